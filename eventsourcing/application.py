@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, List, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, Tuple, Type, TypeVar
 from uuid import UUID
 
 from eventsourcing.domain import (
@@ -209,8 +209,15 @@ class LocalNotificationLog(NotificationLog):
 class Application(ABC, Generic[TAggregate]):
     """
     Base class for event-sourced applications.
+
+    Subclasses may set :data:`snapshotting_intervals` to a dict that
+    maps aggregate classes to version number intervals, so that
+    snapshots will be taken automatically whenever an aggregate's
+    version number is a multiple of the interval for its class.
     """
 
+    snapshotting_intervals: Optional[Dict[Type[Aggregate], int]] = None
+
     def __init__(self) -> None:
         """
         Initialises an application with an
@@ -289,8 +296,9 @@ class Application(ABC, Generic[TAggregate]):
         for use by the application to store and retrieve aggregate
         :class:`~eventsourcing.domain.Snapshot` objects.
         """
-        if not self.factory.is_snapshotting_enabled():
-            return None
+        if not self.snapshotting_intervals:
+            if not self.factory.is_snapshotting_enabled():
+                return None
         recorder = self.factory.aggregate_recorder(purpose="snapshots")
         return self.factory.event_store(
             mapper=self.mapper,
@@ -322,6 +330,8 @@ class Application(ABC, Generic[TAggregate]):
             events += aggregate.collect_events()
         self.events.put(events)
         self.notify(events)
+        if self.snapshots is not None and self.snapshotting_intervals:
+            self.take_interval_snapshots(aggregates, events)
 
     def notify(self, new_events: List[AggregateEvent]) -> None:
         """
@@ -331,6 +341,32 @@ class Application(ABC, Generic[TAggregate]):
         need to take action when new domain events have been saved.
         """
 
+    def take_interval_snapshots(
+        self,
+        aggregates: Tuple[Aggregate, ...],
+        events: List[AggregateEvent],
+    ) -> None:
+        """
+        Takes snapshots of the given aggregates whenever one of the
+        given new domain events has a version number that is a multiple
+        of the interval configured in :data:`snapshotting_intervals`
+        for the aggregate's class.
+        """
+        assert self.snapshotting_intervals is not None
+        intervals = {}
+        for aggregate in aggregates:
+            interval = self.snapshotting_intervals.get(type(aggregate))
+            if interval is not None:
+                intervals[aggregate.id] = interval
+        for event in events:
+            interval = intervals.get(event.originator_id)
+            if interval is not None:
+                if event.originator_version % interval == 0:
+                    self.take_snapshot(
+                        aggregate_id=event.originator_id,
+                        version=event.originator_version,
+                    )
+
     def take_snapshot(self, aggregate_id: UUID, version: Optional[int] = None) -> None:
         """
         Takes a snapshot of the recorded state of the aggregate,
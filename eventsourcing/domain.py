@@ -336,6 +336,8 @@ class BoundEvent:
     on an aggregate so that the aggregate methods can be accessed.
     """
 
+    __slots__ = ("event_decorator", "aggregate")
+
     # noinspection PyShadowingNames
     def __init__(self, event_decorator: EventDecorator, aggregate: TAggregate):
         """
@@ -803,9 +805,8 @@ class Aggregate(ABC, metaclass=MetaAggregate):
         Collects and returns a list of pending aggregate
         :class:`AggregateEvent` objects.
         """
-        collected = []
-        while self.pending_events:
-            collected.append(self.pending_events.pop(0))
+        collected = list(self._pending_events)
+        self._pending_events.clear()
         return collected
 
 
@@ -3,17 +3,16 @@ import os
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from decimal import Decimal
-from distutils.util import strtobool
 from typing import Any, Dict, Generic, Iterator, List, Optional, Type, cast
 from uuid import UUID
 
 from eventsourcing.cipher import Cipher
 from eventsourcing.compressor import Compressor
 from eventsourcing.domain import DomainEvent, TDomainEvent
-from eventsourcing.utils import get_topic, resolve_topic
+from eventsourcing.utils import get_topic, resolve_topic, strtobool
 
 
 class Transcoding(ABC):
@@ -104,11 +103,10 @@ class JSONTranscoder(Transcoder):
                 "_data_": transcoding.encode(o),
             }
 
+    _encoded_obj_keys = frozenset(("_type_", "_data_"))
+
     def _decode_obj(self, d: Dict[str, Any]) -> Any:
-        if set(d.keys()) == {
-            "_type_",
-            "_data_",
-        }:
+        if d.keys() == self._encoded_obj_keys:
             t = d["_type_"]
             t = cast(str, t)
             transcoding = self.names[t]
@@ -180,11 +178,23 @@ class StoredEvent:
     :param bytes state: serialised state of the domain event object
     """
 
+    __slots__ = ("originator_id", "originator_version", "topic", "state")
+
     originator_id: uuid.UUID
     originator_version: int
     topic: str
     state: bytes
 
+    # Because the fields are stored in slots rather than an instance
+    # dict, pickle and copy need a state protocol that bypasses the
+    # frozen __setattr__, as dataclass(slots=True) would generate.
+    def __getstate__(self) -> List[Any]:
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
 
 class Mapper(Generic[TDomainEvent]):
     """
@@ -238,6 +248,9 @@ class Mapper(Generic[TDomainEvent]):
         event_state: dict = self.transcoder.decode(stored_state)
         event_state["originator_id"] = stored.originator_id
         event_state["originator_version"] = stored.originator_version
+        # Topic resolution is memoized in the utils module, which must
+        # remain the only cache: entries are invalidated there when a
+        # topic needs to resolve to an upcast version of a class.
         cls = resolve_topic(stored.topic)
         assert issubclass(cls, DomainEvent)
         class_version = getattr(cls, "class_version", 1)
@@ -297,6 +310,8 @@ class Notification(StoredEvent):
     Frozen dataclass that represents domain event notifications.
     """
 
+    __slots__ = ("id",)
+
     id: int
 
 
@@ -536,9 +551,7 @@ class InfrastructureFactory(ABC):
         Snapshotting is not enabled by default.
         """
         default = "no"
-        return bool(
-            strtobool(self.getenv(self.IS_SNAPSHOTTING_ENABLED, default) or default)
-        )
+        return strtobool(self.getenv(self.IS_SNAPSHOTTING_ENABLED, default) or default)
 
 
 @dataclass(frozen=True)
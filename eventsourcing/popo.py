@@ -1,3 +1,5 @@
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
 from threading import Lock
 from typing import Any, Dict, Iterable, List, Optional
@@ -18,7 +20,9 @@ from eventsourcing.persistence import (
 class POPOAggregateRecorder(AggregateRecorder):
     def __init__(self) -> None:
         self.stored_events: List[StoredEvent] = []
-        self.stored_events_index: Dict[UUID, Dict[int, int]] = defaultdict(dict)
+        self.version_index: Dict[UUID, "array[int]"] = defaultdict(lambda: array("q"))
+        self.position_index: Dict[UUID, "array[int]"] = defaultdict(lambda: array("q"))
+        self.max_versions: Dict[UUID, int] = {}
         self.database_lock = Lock()
 
     def insert_events(self, stored_events: List[StoredEvent], **kwargs: Any) -> None:
@@ -29,22 +33,27 @@ class POPOAggregateRecorder(AggregateRecorder):
     def assert_uniqueness(
         self, stored_events: List[StoredEvent], **kwargs: Any
     ) -> None:
-        new = set()
+        heads: Dict[UUID, int] = {}
         for s in stored_events:
-            # Check events don't already exist.
-            if s.originator_version in self.stored_events_index[s.originator_id]:
+            # Check events are beyond the highest committed version.
+            head = heads.get(s.originator_id)
+            if head is None:
+                head = self.max_versions.get(s.originator_id, -1)
+            if s.originator_version <= head:
                 raise RecordConflictError
-            new.add((s.originator_id, s.originator_version))
-        # Check new events are unique.
-        if len(new) < len(stored_events):
-            raise RecordConflictError
+            heads[s.originator_id] = s.originator_version
 
     def update_table(self, stored_events: List[StoredEvent], **kwargs: Any) -> None:
-        for s in stored_events:
-            self.stored_events.append(s)
-            self.stored_events_index[s.originator_id][s.originator_version] = (
-                len(self.stored_events) - 1
-            )
+        position = len(self.stored_events)
+        self.stored_events.extend(stored_events)
+        version_index = self.version_index
+        position_index = self.position_index
+        max_versions = self.max_versions
+        for position, s in enumerate(stored_events, start=position):
+            originator_id = s.originator_id
+            version_index[originator_id].append(s.originator_version)
+            position_index[originator_id].append(position)
+            max_versions[originator_id] = s.originator_version
 
     def select_events(
         self,
@@ -56,35 +65,40 @@ class POPOAggregateRecorder(AggregateRecorder):
     ) -> List[StoredEvent]:
 
         with self.database_lock:
-            results = []
-
-            index = self.stored_events_index[originator_id]
-            positions: Iterable = index.keys()
-            if desc:
-                positions = reversed(list(positions))
-            for p in positions:
-                if gt is not None:
-                    if not p > gt:
-                        continue
-                if lte is not None:
-                    if not p <= lte:
-                        continue
-                s = self.stored_events[index[p]]
-                results.append(s)
-                if len(results) == limit:
-                    break
-            return results
+            # Return the most recent event directly.
+            if desc and limit == 1 and gt is None and lte is None:
+                positions = self.position_index[originator_id]
+                if positions:
+                    return [self.stored_events[positions[-1]]]
+                else:
+                    return []
+
+            versions = self.version_index[originator_id]
+            positions = self.position_index[originator_id]
+            lo = 0 if gt is None else bisect_right(versions, gt)
+            hi = len(versions) if lte is None else bisect_right(versions, lte)
+            if limit is not None:
+                if desc:
+                    lo = max(lo, hi - limit)
+                else:
+                    hi = min(hi, lo + limit)
+            sliced = positions[lo:hi]
+            selected: Iterable[int] = reversed(sliced) if desc else sliced
+            stored_events = self.stored_events
+            return [stored_events[p] for p in selected]
 
 
 class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
     def select_notifications(self, start: int, limit: int) -> List[Notification]:
         with self.database_lock:
             results = []
-            i = start - 1
-            j = i + limit
-            for notification_id, s in enumerate(self.stored_events[i:j], start):
+            stored_events = self.stored_events
+            i = max(start - 1, 0)
+            j = min(i + limit, len(stored_events))
+            for position in range(i, j):
+                s = stored_events[position]
                 n = Notification(
-                    id=notification_id,
+                    id=position + 1,
                     originator_id=s.originator_id,
                     originator_version=s.originator_version,
                     topic=s.topic,
@@ -1,5 +1,4 @@
 import threading
-from distutils.util import strtobool
 from types import TracebackType
 from typing import Any, Dict, List, Optional, Type
 from uuid import UUID
@@ -20,6 +19,7 @@ from eventsourcing.persistence import (
     StoredEvent,
     Tracking,
 )
+from eventsourcing.utils import strtobool
 
 psycopg2.extras.register_uuid()
 
@@ -52,6 +52,8 @@ class PostgresDatastore:
         return c
 
     class Transaction:
+        __slots__ = ("c",)
+
         # noinspection PyShadowingNames
         def __init__(self, connection: connection):
             self.c = connection
@@ -125,16 +127,15 @@ class PostgresAggregateRecorder(AggregateRecorder):
         stored_events: List[StoredEvent],
         **kwargs: Any,
     ) -> None:
-        params = []
-        for stored_event in stored_events:
-            params.append(
-                (
-                    stored_event.originator_id,
-                    stored_event.originator_version,
-                    stored_event.topic,
-                    stored_event.state,
-                )
+        params = [
+            (
+                stored_event.originator_id,
+                stored_event.originator_version,
+                stored_event.topic,
+                stored_event.state,
             )
+            for stored_event in stored_events
+        ]
         c.executemany(self.insert_events_statement, params)
 
     def select_events(
@@ -162,19 +163,18 @@ class PostgresAggregateRecorder(AggregateRecorder):
             statement += "LIMIT %s "
             params.append(limit)
         # statement += ";"
-        stored_events = []
         try:
             with self.datastore.transaction() as c:
                 c.execute(statement, params)
-                for row in c.fetchall():
-                    stored_events.append(
-                        StoredEvent(
-                            originator_id=row["originator_id"],
-                            originator_version=row["originator_version"],
-                            topic=row["topic"],
-                            state=bytes(row["state"]),
-                        )
+                stored_events = [
+                    StoredEvent(
+                        originator_id=row["originator_id"],
+                        originator_version=row["originator_version"],
+                        topic=row["topic"],
+                        state=bytes(row["state"]),
                     )
+                    for row in c.fetchall()
+                ]
         except psycopg2.Error as e:
             raise OperationalError(e)
         return stored_events
@@ -228,17 +228,16 @@ class PostgresApplicationRecorder(
         try:
             with self.datastore.transaction() as c:
                 c.execute(self.statement_notifications_statement, params)
-                notifications = []
-                for row in c.fetchall():
-                    notifications.append(
-                        Notification(
-                            id=row["notification_id"],
-                            originator_id=row["originator_id"],
-                            originator_version=row["originator_version"],
-                            topic=row["topic"],
-                            state=bytes(row["state"]),
-                        )
+                notifications = [
+                    Notification(
+                        id=row["notification_id"],
+                        originator_id=row["originator_id"],
+                        originator_version=row["originator_version"],
+                        topic=row["topic"],
+                        state=bytes(row["state"]),
                     )
+                    for row in c.fetchall()
+                ]
         except psycopg2.Error as e:
             raise OperationalError(e)
         return notifications
@@ -396,4 +395,4 @@ class Factory(InfrastructureFactory):
 
     def env_create_table(self) -> bool:
         default = "yes"
-        return bool(strtobool(self.getenv(self.CREATE_TABLE, default) or default))
+        return strtobool(self.getenv(self.CREATE_TABLE, default) or default)
@@ -93,6 +93,23 @@ class AggregateRecorderTestCase(TestCase, ABC):
             stored_event3,
         )
 
+        # Check descending reads are ordered by descending version.
+        events = recorder.select_events(originator_id, desc=True)
+        self.assertEqual(
+            [e.originator_version for e in events],
+            [2, 1, 0],
+        )
+        events = recorder.select_events(originator_id, desc=True, limit=2)
+        self.assertEqual(
+            [e.originator_version for e in events],
+            [2, 1],
+        )
+        events = recorder.select_events(originator_id, gt=0, lte=2, desc=True)
+        self.assertEqual(
+            [e.originator_version for e in events],
+            [2, 1],
+        )
+
     def test_performance(self):
 
         # Construct the recorder.
@@ -170,6 +170,30 @@ class TestApplicationSnapshottingException(TestCase):
         )
 
 
+class TestApplicationSnapshottingIntervals(TestCase):
+    def test_snapshots_taken_automatically(self):
+        app = BankAccountsWithAutomaticSnapshotting()
+
+        # Open an account and credit it a few times.
+        account_id = app.open_account(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+        for _ in range(9):
+            app.credit_account(account_id, Decimal("10.00"))
+
+        # Check snapshots have been taken at the configured interval.
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual(snapshots[0].originator_version, 5)
+        self.assertEqual(snapshots[1].originator_version, 10)
+
+        # Check the aggregate can be reconstructed.
+        account = app.get_account(account_id)
+        self.assertEqual(account.version, 10)
+        self.assertEqual(account.balance, Decimal("90.00"))
+
+
 class TestApplicationWithSQLite(TestApplicationWithPOPO):
     timeit_number = 30 * TIMEIT_FACTOR
 
@@ -252,3 +276,7 @@ class BankAccounts(Application):
 
     class AccountNotFoundError(Exception):
         pass
+
+
+class BankAccountsWithAutomaticSnapshotting(BankAccounts):
+    snapshotting_intervals = {BankAccount: 5}
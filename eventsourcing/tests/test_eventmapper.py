@@ -1,3 +1,5 @@
+import pickle
+from copy import copy, deepcopy
 from datetime import datetime
 from decimal import Decimal
 from unittest.case import TestCase
@@ -11,6 +13,8 @@ from eventsourcing.persistence import (
     DecimalAsStr,
     JSONTranscoder,
     Mapper,
+    Notification,
+    StoredEvent,
     Transcoding,
     UUIDAsHex,
 )
@@ -147,3 +151,27 @@ class TestTranscoder(TestCase):
         self.assertIsInstance(copy.value, CustomType1)
         self.assertIsInstance(copy.value.value, UUID)
         self.assertEqual(copy.value.value, obj.value.value)
+
+
+class TestStoredEvent(TestCase):
+    def test_pickle_and_copy(self):
+        stored_event = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic1",
+            state=b"state1",
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(stored_event)), stored_event)
+        self.assertEqual(copy(stored_event), stored_event)
+        self.assertEqual(deepcopy(stored_event), stored_event)
+
+        notification = Notification(
+            id=1,
+            originator_id=stored_event.originator_id,
+            originator_version=1,
+            topic="topic1",
+            state=b"state1",
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(notification)), notification)
+        self.assertEqual(copy(notification), notification)
+        self.assertEqual(deepcopy(notification), notification)
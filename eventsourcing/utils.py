@@ -7,9 +7,16 @@ def get_topic(cls: type) -> str:
     """
     Returns a string that locates the given class.
     """
-    topic = f"{cls.__module__}:{cls.__qualname__}"
-    _objs_cache[topic] = cls
-    return topic
+    try:
+        return _topics_cache[cls]
+    except KeyError:
+        topic = f"{cls.__module__}:{cls.__qualname__}"
+        _topics_cache[cls] = topic
+        _objs_cache[topic] = cls
+        return topic
+
+
+_topics_cache: Dict[type, str] = {}
 
 
 def resolve_topic(topic: str) -> Any:
@@ -41,6 +48,23 @@ def get_module(module_name: str) -> ModuleType:
 _modules_cache: Dict[str, Any] = {}
 
 
+def strtobool(val: str) -> bool:
+    """
+    Converts a string representation of truth to True or False.
+
+    True values are 'y', 'yes', 't', 'true', 'on', and '1'; false values
+    are 'n', 'no', 'f', 'false', 'off', and '0'. Raises ValueError if
+    'val' is anything else.
+    """
+    val = val.lower()
+    if val in ("y", "yes", "t", "true", "on", "1"):
+        return True
+    elif val in ("n", "no", "f", "false", "off", "0"):
+        return False
+    else:
+        raise ValueError(f"invalid truth value {val!r}")
+
+
 def resolve_attr(obj: Any, path: str) -> Any:
     if not path:
         return obj